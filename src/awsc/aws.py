@@ -3,6 +3,8 @@ Module for working with the AWS API.
 """
 
 import os
+from threading import Thread
+
 import boto3
 from botocore import config as botoconf
 from botocore import exceptions as botoerror
@@ -19,36 +21,58 @@ class AWS:
 
     signature_version_overrides = {"s3": "s3v4"}
 
+    retry_overrides = {"elasticbeanstalk": {"mode": "adaptive", "max_attempts": 10}}
+
+    max_pool_connections = 50
+
+    # Older botocore releases, such as the one pinned in requirements.txt, reject the tcp_keepalive option.
+    tcp_keepalive = "tcp_keepalive" in botoconf.Config.OPTION_DEFAULTS
+
     def __init__(self):
         """
-        Initializes an AWS object.
+        Initializes an AWS object. The initial caller identification runs on a background thread, so that startup is not blocked by an
+        STS round trip. The STS client is created before the thread starts, as client creation on the default boto3 session is not
+        thread-safe.
         """
+        self._regions = {}
+        self._clients = {}
+        self._configs = {}
         Common.Session.context_update_hooks.append(self.idcaller)
-        self.idcaller()
+        Thread(target=self.idcaller, args=(self("sts"),), daemon=True).start()
 
     def conf(self, svc=""):
         """
-        Generates a boto3 configuration object from the current awsc session.
+        Generates a boto3 configuration object from the current awsc session. Configuration objects are built once per service and region.
 
         Returns
         -------
         botocore.config.Config
-            The configuration object with the region and signature version set.
+            The configuration object with the region, signature version, retry and connection pool settings set.
         """
         region = (
             Common.Session.region
             if svc not in self.region_overrides
             else self.region_overrides[svc]
         )
+        if (svc, region) in self._configs:
+            return self._configs[(svc, region)]
         signature_version = (
             "v4"
             if svc not in self.signature_version_overrides
             else self.signature_version_overrides[svc]
         )
-        return botoconf.Config(
+        retries = None if svc not in self.retry_overrides else self.retry_overrides[svc]
+        options = {}
+        if self.tcp_keepalive:
+            options["tcp_keepalive"] = True
+        self._configs[(svc, region)] = botoconf.Config(
             region_name=region,
             signature_version=signature_version,
+            retries=retries,
+            max_pool_connections=self.max_pool_connections,
+            **options,
         )
+        return self._configs[(svc, region)]
 
     def env_session(self):
         """
@@ -90,7 +114,8 @@ class AWS:
 
     def __call__(self, service, keys=None):
         """
-        Shorthand for boto3.client().
+        Shorthand for boto3.client(). Clients for an explicit keypair are cached by service, region, credentials and endpoint, so repeated
+        calls reuse the same client.
 
         Parameters
         ----------
@@ -107,32 +132,30 @@ class AWS:
         """
         config = self.conf(service)
         if not Common.Session.context_is_valid:
-            return boto3.client(service)  # Let magic sort it out
+            return boto3.client(service, config=config)  # Let magic sort it out
         if keys is None:
             if Common.Session.context not in Common.Configuration.keystore:
-                return boto3.client(service)  # Let magic sort it out
+                return boto3.client(service, config=config)  # Let magic sort it out
             keys = Common.Configuration.keystore[Common.Session.context]
         access = keys["access"]
         secret = keys["secret"]
-        endpoint = None
-        session = None
-        if "session" in keys:
-            session = keys["session"]
-        if "endpoint_url" in Common.Configuration.enumerated_contexts()[Common.Session.context]:
-            endpoint = Common.Configuration.enumerated_contexts()[Common.Session.context][
-                "endpoint_url"
-            ]
-        client = boto3.client(
-            service,
-            aws_access_key_id=access,
-            aws_secret_access_key=secret,
-            aws_session_token=session,
-            config=config,
-            endpoint_url=endpoint,
-        )
-        return client
+        session = keys.get("session")
+        endpoint = Common.Configuration.enumerated_contexts()[
+            Common.Session.context
+        ].get("endpoint_url")
+        key = (service, config.region_name, access, secret, session, endpoint)
+        if key not in self._clients:
+            self._clients[key] = boto3.client(
+                service,
+                aws_access_key_id=access,
+                aws_secret_access_key=secret,
+                aws_session_token=session,
+                config=config,
+                endpoint_url=endpoint,
+            )
+        return self._clients[key]
 
-    def whoami(self, keys=None):
+    def whoami(self, keys=None, sts=None):
         """
         Shorthand for the GetCallerIdentity STS API call.
 
@@ -141,6 +164,8 @@ class AWS:
         keys : dict
             A dict-like object with the "access" and "secret" keys set. If None, the currently
             active keypair in the configuration is used.
+        sts : object, optional
+            An already created STS client to use. If None, a client is created for keys.
 
         Returns
         -------
@@ -148,7 +173,9 @@ class AWS:
             The API response for GetCallerIdentity.
         """
         try:
-            return self("sts", keys).get_caller_identity()
+            if sts is None:
+                sts = self("sts", keys)
+            return sts.get_caller_identity()
         except botoerror.NoCredentialsError:
             return {
                 "UserId": "<UNAUTHENTICATED>",
@@ -158,26 +185,39 @@ class AWS:
 
     def list_regions(self):
         """
-        Shorthand for enumerating the result of the DescribeRegions EC2 API call.
+        Shorthand for enumerating the result of the DescribeRegions EC2 API call. The result is cached per context, as the set of
+        regions does not change over the lifetime of the process.
 
         Returns
         -------
-        list
-            A list of valid region names for EC2.
-        """
-        return [
-            region["RegionName"]
-            for region in self("ec2").describe_regions(AllRegions=True)["Regions"]
-        ]
+        tuple
+            A sorted tuple of valid region names for EC2.
+        """
+        context = Common.Session.context
+        if context not in self._regions:
+            self._regions[context] = tuple(
+                sorted(
+                    region["RegionName"]
+                    for region in self("ec2").describe_regions(AllRegions=True)[
+                        "Regions"
+                    ]
+                )
+            )
+        return self._regions[context]
 
-    def idcaller(self):
+    def idcaller(self, sts=None):
         """
         Sets the info display for the account and user ID of the currently selected keypair.
 
         AWSC must be fully initialized before calling.
+
+        Parameters
+        ----------
+        sts : object, optional
+            An already created STS client for the currently selected keypair. If None, a client is created.
         """
         try:
-            whoami = self.whoami()
+            whoami = self.whoami(sts=sts)
             try:
                 del Common.Session.info_display.special_colors["Account"]
             except KeyError:
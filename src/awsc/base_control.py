@@ -5,8 +5,11 @@ effort as possible.
 
 import datetime
 import json
+import re
 import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from operator import attrgetter
 from typing import Any, Callable, Dict, List
 
@@ -91,7 +94,7 @@ def generic_confirm_template(
     custom_callback : Callable, optional
         A replacement callback for handling the confirmation.
     refresh : bool, default: True
-        Whether to call refresh_data() after executing the action.
+        Whether to call refresh_data() after executing the action. Failed actions do not trigger a refresh.
     category : str
         API call category, for logging purposes. Usually a pretty printed name for the AWS service that
         is being used.
@@ -160,11 +163,17 @@ def generic_confirm_template(
         def callback(**cb_kwargs):
             if custom_callback is not None:
                 custom_callback(**cb_kwargs)
-            else:
-                Common.generic_api_call(
+                if refresh:
+                    self.refresh_data()
+                return
+            # Resolve against the current selection before leaving the UI thread, the API call itself runs in the background.
+            api_kwargs = template.resolve(self.selection, **kwargs, **cb_kwargs)
+
+            def perform():
+                result = Common.generic_api_call(
                     provider,
                     method,
-                    template.resolve(self.selection, **kwargs, **cb_kwargs),
+                    api_kwargs,
                     summary,
                     category,
                     subcategory=subcategory,
@@ -172,8 +181,12 @@ def generic_confirm_template(
                     resource=rid,
                     **cb_kwargs,
                 )
-            if refresh:
-                self.refresh_data()
+                if not result["Success"]:
+                    return
+                if refresh:
+                    self.refresh_data()
+
+            threading.Thread(target=perform, daemon=True).start()
 
         fwn = from_what_name
         if fwn is not None and hasattr(fwn, "resolve") and callable(fwn.resolve):
@@ -441,6 +454,48 @@ def next_marker_end(next_marker, next_marker_behaviour):
     return True
 
 
+SimpleJqPath = re.compile(r"(?:\.[A-Za-z_][A-Za-z0-9_]*)+")
+
+
+def _jq_column(path, item, **kwargs):
+    try:
+        return Common.Session.jq(path).input(item).first()
+    except StopIteration:
+        return ""
+
+
+def compile_column_path(path):
+    """
+    Compiles a column path into a column callback. Plain object traversals such as .Tier.Name are resolved with dict lookups instead of
+    running the item through jq, everything else is evaluated by jq.
+
+    Parameters
+    ----------
+    path : str
+        The jq expression for the column.
+
+    Returns
+    -------
+    callable(dict) -> object
+        A column callback which takes a single item and returns the value of the column for that item.
+    """
+    if not SimpleJqPath.fullmatch(path):
+        return lambda item, **kwargs: _jq_column(path, item)
+    keys = path[1:].split(".")
+
+    def fn(item, **kwargs):
+        value = item
+        for key in keys:
+            if not isinstance(value, dict):
+                if value is None:
+                    return None
+                return _jq_column(path, item)
+            value = value.get(key)
+        return value
+
+    return fn
+
+
 # TODO: Reimplement resource listers as subclasses of OpenableListControl for consistency.
 # TODO: Improve implementation of ResourceListerBase by moving class configuration attributes (eg. primary_key) to class attributes.
 class ResourceListerBase(ListControl):
@@ -467,8 +522,36 @@ class ResourceListerBase(ListControl):
         The argument name for the next marker in AWS API calls.
     auto_refresh_last : datetime.datetime
         Represents the last time an automatic refresh happened.
+    response_ttl : int
+        The number of seconds list API responses are reused for by get_data_generic. Zero disables caching. Meant for listers of near-static
+        data, such as platform versions.
+    _responses : dict
+        Shared between instances. Cached list API responses with their expiry time, keyed by context, region, provider, method and
+        arguments.
     """
 
+    response_ttl = 0
+    _responses: Dict[tuple, tuple] = {}
+
+    @staticmethod
+    def evict_responses(provider=None, method=None):
+        """
+        Removes expired entries from the list API response cache. If provider and method are set, their entries for the current context
+        and region are removed regardless of expiry.
+
+        Parameters
+        ----------
+        provider : str, optional
+            A boto3 provider name.
+        method : str, optional
+            The list method of the provider.
+        """
+        now = time.monotonic()
+        forced = (Common.Session.context, Common.Session.region, provider, method)
+        for key, (expires_at, _) in list(ResourceListerBase._responses.items()):
+            if expires_at <= now or key[:4] == forced:
+                ResourceListerBase._responses.pop(key, None)
+
     def __init__(self, *args, **kwargs):
         if not hasattr(self, "primary_key"):
             self.primary_key = None
@@ -633,6 +716,7 @@ class ResourceListerBase(ListControl):
         *args,
         next_marker_behaviour="omit",
         debug_one=False,
+        provider=None,
     ):
         """
         Generic data retrieval function designed to interact with the AWS API.
@@ -656,26 +740,24 @@ class ResourceListerBase(ListControl):
             The name of the next marker field in the AWS API response.
         next_marker_arg : str
             The keyword argument for the next marker field for the list method.
+        provider : object, optional
+            An already resolved boto3 client for resource_key. If None, the client is resolved through the session.
 
         Yields
         ------
         list(ListEntry)
             A list of new entries. The generator yields after each API call the result of that single API call.
         """
-        try:
-            provider = Common.Session.service_provider(resource_key)
-        except KeyError:
-            Common.error(
-                "boto3 does not recognize provider",
-                "Invalid provider",
-                "Core",
-                subcategory="ResourceListerBase",
-                api_provider=resource_key,
-                classname=type(self).__name__,
-            )
-            return []
+        if provider is None:
+            provider = self.resolve_provider(resource_key)
+            if provider is None:
+                return []
         if callable(list_kwargs):
             list_kwargs = list_kwargs()
+        all_columns = {
+            column: path if callable(path) else compile_column_path(path)
+            for column, path in {**column_paths, **hidden_columns}.items()
+        }
         ret = []
         next_marker = NextMarkerInitial
         while not next_marker_end(next_marker, next_marker_behaviour):
@@ -694,20 +776,39 @@ class ResourceListerBase(ListControl):
                         if next_marker[idx] is None and next_marker_behaviour == "omit":
                             continue
                         it_list_kwargs[elem] = next_marker[idx]
-            try:
-                response = getattr(provider, list_method)(**it_list_kwargs)
-            except botoerror.ClientError as error:
-                Common.clienterror(
-                    error,
-                    "List Resources",
-                    "Core",
-                    subcategory="ResourceListerBase",
-                    api_provider=resource_key,
-                    api_method=list_method,
-                    api_kwargs=it_list_kwargs,
+            cached = None
+            if self.response_ttl:
+                cache_key = (
+                    Common.Session.context,
+                    Common.Session.region,
+                    resource_key,
+                    list_method,
+                    json.dumps(it_list_kwargs, sort_keys=True, default=str),
                 )
-                # pylint: disable=raise-missing-from # StopLoadingData is a special exception to stop this generator from being used.
-                raise StopLoadingData
+                cached = ResourceListerBase._responses.get(cache_key)
+            if cached is not None and time.monotonic() < cached[0]:
+                response = cached[1]
+            else:
+                try:
+                    response = getattr(provider, list_method)(**it_list_kwargs)
+                except botoerror.ClientError as error:
+                    Common.clienterror(
+                        error,
+                        "List Resources",
+                        "Core",
+                        subcategory="ResourceListerBase",
+                        api_provider=resource_key,
+                        api_method=list_method,
+                        api_kwargs=it_list_kwargs,
+                    )
+                    # pylint: disable=raise-missing-from # StopLoadingData is a special exception to stop this generator from being used.
+                    raise StopLoadingData
+                if self.response_ttl:
+                    ResourceListerBase.evict_responses()
+                    ResourceListerBase._responses[cache_key] = (
+                        time.monotonic() + self.response_ttl,
+                        response,
+                    )
 
             if debug_one is True:
                 Common.info(
@@ -745,14 +846,8 @@ class ResourceListerBase(ListControl):
                 if self.closed:
                     raise StopLoadingData
                 init = {}
-                for column, path in {**column_paths, **hidden_columns}.items():
-                    if callable(path):
-                        init[column] = path(item, caller=self)
-                    else:
-                        try:
-                            init[column] = Common.Session.jq(path).input(item).first()
-                        except StopIteration:
-                            init[column] = ""
+                for column, path in all_columns.items():
+                    init[column] = path(item, caller=self)
                 list_entry = ListEntry(**init)
                 list_entry.controller_data = item
                 if self.matches(list_entry, *args):
@@ -782,6 +877,33 @@ class ResourceListerBase(ListControl):
             else:
                 next_marker = ""
 
+    def resolve_provider(self, resource_key):
+        """
+        Resolves the boto3 client for a provider name, reporting an error if boto3 does not recognize it.
+
+        Parameters
+        ----------
+        resource_key : str
+            A boto3 provider name.
+
+        Returns
+        -------
+        object
+            The boto3 client, or None if the provider is not recognized.
+        """
+        try:
+            return Common.Session.service_provider(resource_key)
+        except KeyError:
+            Common.error(
+                "boto3 does not recognize provider",
+                "Invalid provider",
+                "Core",
+                subcategory="ResourceListerBase",
+                api_provider=resource_key,
+                classname=type(self).__name__,
+            )
+            return None
+
     def matches(self, list_entry, *args):
         """
         For pre-filtering resource listers, this function decides whether a list entry being generated matches the criteria for being
@@ -1808,7 +1930,7 @@ class ResourceLister(ResourceListerBase):
                     ),
                     command_spec["tooltip"],
                 )
-        self.add_hotkey(ControlCodes.R, self.refresh_data, "Refresh")
+        self.add_hotkey(ControlCodes.R, self.force_refresh, "Refresh")
         self.add_hotkey(ControlCodes.P, self.refresh_data_debug)
         if "arn" in self.column_paths or "arn" in self.hidden_columns:
             self.add_hotkey("r", self.copy_arn, "Copy ARN")
@@ -1949,6 +2071,14 @@ class ResourceLister(ResourceListerBase):
         self.auto_refresh_last = datetime.datetime.now()
         self.asynch(self.get_data)
 
+    def force_refresh(self, *args):
+        """
+        Hotkey callback. Discards the cached list responses of this lister, then refreshes it.
+        """
+        if self.response_ttl:
+            ResourceListerBase.evict_responses(self.main_provider, self.list_method)
+        self.refresh_data()
+
     def refresh_data_debug(self, *args, **kwargs):
         """
         Performs a full refresh asynchronously, fetching all data again and updating all entries as required.
@@ -2155,10 +2285,17 @@ class MultiLister(ResourceListerBase):
     """
     A MulitLister is similar to a SingleRelationLister in the ability to list multiple resources in a single control. A MultiLister however acquires this data
     from several different listing API calls rather than from a single resource's description.
+
+    Attributes
+    ----------
+    list_workers : int
+        The number of resource descriptors listed concurrently by get_data. With the default of 1, descriptors are listed one after the other.
+        boto3 clients are resolved on the calling thread before the workers start, as client creation is not thread-safe.
     """
 
     prefix = "CHANGEME"
     title = "CHANGEME"
+    list_workers = 1
 
     def title_info(self):
         """
@@ -2243,22 +2380,51 @@ class MultiLister(ResourceListerBase):
         awsc.termui.list_control.ListEntry
             A row to insert.
         """
+        if self.list_workers <= 1:
+            for elem in self.resource_descriptors:
+                try:
+                    yield from self._get_descriptor_data(elem)
+                except NoResults:
+                    continue
+            return
+        providers = {}
         for elem in self.resource_descriptors:
-            try:
-                for y in self.get_data_generic(
-                    elem["resource_key"],
-                    elem["list_method"],
-                    elem["list_kwargs"],
-                    elem["item_path"],
-                    elem["column_paths"],
-                    elem["hidden_columns"],
-                    None,
-                    None,
+            if elem["resource_key"] not in providers:
+                providers[elem["resource_key"]] = self.resolve_provider(
+                    elem["resource_key"]
+                )
+        with ThreadPoolExecutor(max_workers=self.list_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._collect_descriptor_data,
                     elem,
-                ):
-                    yield y
-            except NoResults:
-                continue
+                    providers[elem["resource_key"]],
+                )
+                for elem in self.resource_descriptors
+                if providers[elem["resource_key"]] is not None
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def _get_descriptor_data(self, elem, provider=None):
+        return self.get_data_generic(
+            elem["resource_key"],
+            elem["list_method"],
+            elem["list_kwargs"],
+            elem["item_path"],
+            elem["column_paths"],
+            elem["hidden_columns"],
+            None,
+            None,
+            elem,
+            provider=provider,
+        )
+
+    def _collect_descriptor_data(self, elem, provider):
+        try:
+            return list(self._get_descriptor_data(elem, provider))
+        except NoResults:
+            return []
 
     def matches(self, list_entry, *args):
         elem = args[0]
@@ -207,10 +207,8 @@ class Commander(Control):
         valid but autocompletes to a valid command, that command is used instead. If neither is valid, does nothing.
         """
         text = self.text.lower()
-        option = None
-        if text in self.options:
-            option = self.options[text]
-        else:
+        option = self.options.get(text)
+        if option is None:
             acp = self.autocomplete()
             if acp is not None:
                 option = self.options[acp]
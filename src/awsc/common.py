@@ -226,6 +226,14 @@ class Common:
         Whether Common was initialized.
     init_hooks : set(callable)
         A set of hooks to execute after initialization.
+    _colors : dict
+        Cache of resolved scheme colors, keyed by name and fallback.
+    _colors_style : dict
+        The scheme style the color cache was filled from. The cache is discarded when the scheme is reloaded.
+    _borders : dict
+        Cache of resolved scheme border styles, keyed by name and fallback.
+    _borders_style : dict
+        The scheme style the border cache was filled from. The cache is discarded when the scheme is reloaded.
     """
 
     Configuration: Config = Config()
@@ -233,6 +241,10 @@ class Common:
     _logholder = None
     initialized = False
     init_hooks: Set[Callable[[], None]] = set()
+    _colors: dict = {}
+    _colors_style = None
+    _borders: dict = {}
+    _borders_style = None
 
     @classmethod
     def run_on_init(cls, hook):
@@ -281,10 +293,29 @@ class Common:
     def load_dot_aws(cls):
         """
         Parse and load the contents of ~/.awsc/credentials. Adds contexts registered in that file as awsc contexts.
+
+        Every imported context is verified through STS, so the import is skipped if the file has not changed since the last fully
+        successful import and every context imported back then still exists.
         """
         aws_creds = Path.home() / ".aws" / "credentials"
-        print("Loading ~/.aws/credentials", file=sys.stderr)
         try:
+            stat = aws_creds.stat()
+            file_stamp = [stat.st_mtime_ns, stat.st_size]
+            last_stamp = cls.Configuration["dot_aws_stamp"] or []
+            if (
+                len(last_stamp) == 3
+                and last_stamp[:2] == file_stamp
+                and all(
+                    context in cls.Configuration["contexts"]
+                    for context in last_stamp[2]
+                )
+            ):
+                print(
+                    "~/.aws/credentials is unchanged since the last import, skipping",
+                    file=sys.stderr,
+                )
+                return
+            print("Loading ~/.aws/credentials", file=sys.stderr)
             with aws_creds.open("r", encoding="utf-8") as file:
                 creds = file.read()
         except OSError as error:
@@ -295,6 +326,8 @@ class Common:
             return
         parser = configparser.ConfigParser(default_section="__default")
         parser.read_string(creds)
+        complete = True
+        imported = []
         for section in parser.sections():
             if "aws_security_token" in parser[section]:
                 print(
@@ -332,6 +365,7 @@ class Common:
                     api_args={},
                     credentials_section=section,
                 )
+                complete = False
                 continue
             mfa_device = (
                 ""
@@ -341,50 +375,76 @@ class Common:
             cls.Configuration.add_or_edit_context(
                 section, whoami["Account"], access, secret, mfa_device=mfa_device
             )
+            imported.append(section)
             print(
                 f"Added {section} context from aws credentials file",
                 file=sys.stderr,
             )
+        if complete:
+            cls.Configuration["dot_aws_stamp"] = [*file_stamp, imported]
+            cls.Configuration.write_config()
 
     @staticmethod
     def color(name, fallback=None):
         """
         Fetch a scheme color by name, with an optional fallback color if the main requested color is not present.
+
+        Resolved colors are cached until the scheme is reloaded.
         """
         if Common.Configuration is None:
             raise ValueError("Configuration is not initialized.")
-        if name not in Common.Configuration.scheme["colors"]:
-            if fallback is None:
-                raise KeyError(f'Undefined color "{name}"')
-            return Common.color(fallback)
-        return Color(
-            Palette8Bit(),
-            Common.Configuration.scheme["colors"][name]["foreground"],
-            background=Common.Configuration.scheme["colors"][name]["background"],
-        )
+        style = Common.Configuration.scheme.style
+        if Common._colors_style is not style:
+            Common._colors = {}
+            Common._colors_style = style
+        key = (name, fallback)
+        if key not in Common._colors:
+            colors = style["colors"]
+            if name not in colors:
+                if fallback is None:
+                    raise KeyError(f'Undefined color "{name}"')
+                Common._colors[key] = Common.color(fallback)
+            else:
+                Common._colors[key] = Color(
+                    Palette8Bit(),
+                    colors[name]["foreground"],
+                    background=colors[name]["background"],
+                )
+        return Common._colors[key]
 
     @staticmethod
     def border(name, fallback=None):
         """
         Fetch a scheme border style by name, with an optional fallback border style if the main requested style is not present.
+
+        Resolved border styles are cached until the scheme is reloaded.
         """
         if Common.Configuration is None:
             raise ValueError("Configuration is not initialized.")
-        if name not in Common.Configuration.scheme["borders"]:
-            if fallback is None:
-                raise KeyError(f'Undefined border "{name}"')
-            return Common.border(fallback)
-        border = Common.Configuration.scheme["borders"][name]
-        return BorderStyle(
-            [
-                border["horizontal"],
-                border["vertical"],
-                border["TL"],
-                border["TR"],
-                border["BL"],
-                border["BR"],
-            ]
-        )
+        style = Common.Configuration.scheme.style
+        if Common._borders_style is not style:
+            Common._borders = {}
+            Common._borders_style = style
+        key = (name, fallback)
+        if key not in Common._borders:
+            borders = style["borders"]
+            if name not in borders:
+                if fallback is None:
+                    raise KeyError(f'Undefined border "{name}"')
+                Common._borders[key] = Common.border(fallback)
+            else:
+                border = borders[name]
+                Common._borders[key] = BorderStyle(
+                    [
+                        border["horizontal"],
+                        border["vertical"],
+                        border["TL"],
+                        border["TR"],
+                        border["BL"],
+                        border["BR"],
+                    ]
+                )
+        return Common._borders[key]
 
     @staticmethod
     def main():
@@ -842,9 +902,7 @@ class LogHolder:
         """
         if self.control is not None:
             self.control.entries.clear()
-            for entry in self.raw_entries:
-                self.control.add_raw_entry(entry)
-            self.control.sort()
+            self.control.add_raw_entries(self.raw_entries)
 
     def write_raw_entries(self):
         """
@@ -879,8 +937,7 @@ class LogHolder:
             The control to attach.
         """
         self.control = control
-        for entry in self.raw_entries:
-            self.control.add_raw_entry(entry)
+        self.control.add_raw_entries(self.raw_entries)
 
     def detach(self):
         """
@@ -2,7 +2,10 @@
 Module for the configuration parser object.
 """
 
+import os
+import stat
 import sys
+import tempfile
 import time
 import yaml
 
@@ -12,7 +15,7 @@ from urllib import parse as urlparse
 from .scheme import Scheme
 from .storage import Keystore
 
-LAST_CONFIG_VERSION = 22
+LAST_CONFIG_VERSION = 23
 
 
 class Config:
@@ -33,6 +36,8 @@ class Config:
         The color scheme holder instance.
     config : dict
         The loaded configuration.
+    written : str
+        The serialized configuration as last written to config_path, used to skip writes which would not change the file.
     """
 
     def __init__(self, path=None):
@@ -68,6 +73,7 @@ class Config:
             20: self._update_20,
             21: self._update_21,
             22: self._update_22,
+            23: self._update_23,
         }
         if path is None:
             path = Path.home() / ".config" / "awsc"
@@ -79,6 +85,7 @@ class Config:
         self.keystore = Keystore(self)
         self.scheme = Scheme(self)
         self.ephemeral_contexts = {}
+        self.written = None
 
         self.config_path = self.path / "config.yaml"
 
@@ -294,6 +301,14 @@ class Config:
         """
         self.config["keycloak"] = {}
 
+    def _update_23(self):
+        """
+        Version 23 configuration update.
+
+        Do not call.
+        """
+        self.config["dot_aws_stamp"] = None
+
     def update_version(self):
         """
         Main configuration update sequence. Always called by initialize(), not required to call separately.
@@ -346,16 +361,36 @@ class Config:
             "default_dashboard_layout": [["Blank", "Blank"], ["Blank", "Blank"]],
             "dashboard_layouts": {},
             "error_log": str(error_path),
+            "dot_aws_stamp": None,
         }
 
         self.write_config()
 
     def write_config(self):
         """
-        Immediately writes the configuration to the configuration file in config_path.
-        """
-        with self.config_path.open("w", encoding="utf-8") as file:
-            file.write(yaml.dump(self.config))
+        Immediately writes the configuration to the configuration file in config_path. The write is skipped if the serialized
+        configuration is identical to what was last written. The file is replaced atomically, so a reader never sees a partially
+        written configuration. If the configuration file is a symlink, its target is replaced, and the mode of an existing file is kept.
+        """
+        payload = yaml.dump(self.config)
+        if payload == self.written:
+            return
+        target = os.path.realpath(self.config_path)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target), prefix=".config.yaml."
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(payload)
+            try:
+                os.chmod(tmp_path, stat.S_IMODE(os.stat(target).st_mode))
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.written = payload
 
     def __contains__(self, item):
         return item in self.config
@@ -108,41 +108,23 @@ class HotkeyDisplay(Control):
         super().paint()
         ((x0, x1), (y0, y1)) = self.inner
         width = x1 - x0 + 1
-        colw = int(width / self.cols)
-        x = x0
-        y = y0
-        col = 0
-        longest = []
+        colw = width // self.cols
+        rows = max(1, y1 - y0 + 1)
         tooltips = {**self.holder.tooltips, **self.session.global_hotkey_tooltips}
-        labels = []
-        generated = {}
-        for hotkey, tooltip in tooltips.items():
-            display = (
-                "<"
-                + (
-                    HotkeyDisplay.translations[hotkey]
-                    if hotkey in HotkeyDisplay.translations
-                    else hotkey
-                )
-                + "> "
-            )
-            labels.append(display)
-            generated[hotkey] = display
+        labels = [
+            "<" + HotkeyDisplay.translations.get(hotkey, hotkey) + "> "
+            for hotkey in tooltips
+        ]
         longest = column_sizer(y0, y1, labels, None)
-        for hotkey, tooltip in tooltips.items():
-            display = generated[hotkey]
-            if len(display) < longest[col]:
-                display += " " * (longest[col] - len(display))
-            Common.Session.ui.print(
-                display, xy=(x, y), color=self.highlight_color, bold=True
-            )
-            text = tooltip if not callable(tooltip) else tooltip()
-
-            if len(text) > colw - longest[col]:
-                text = text[: colw - longest[col]]
-            Common.Session.ui.print(
-                text, xy=(x + longest[col], y), color=self.generic_color
+        limits = [colw - length for length in longest]
+        print_segments = Common.Session.ui.print_segments
+        for idx, (display, tooltip) in enumerate(zip(labels, tooltips.values())):
+            col, row = divmod(idx, rows)
+            text = (tooltip if not callable(tooltip) else tooltip())[: limits[col]]
+            print_segments(
+                (
+                    (display.ljust(longest[col]), self.highlight_color, True),
+                    (text, self.generic_color, False),
+                ),
+                (x0 + col * colw, y0 + row),
             )
-            y += 1
-            if y > y1:
-                (x, y, col) = (x + colw, y0, col + 1)
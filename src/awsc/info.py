@@ -17,9 +17,7 @@ class InfoDisplay(Control):
     Attributes
     ----------
     info : dict
-        The actual info being displayed, as a mapping of label to data.
-    order : list
-        The order in which the info should be displayed.
+        The actual info being displayed, as a mapping of label to data. Labels are displayed in insertion order.
     special_colors : dict
         A mapping of label to color for which pieces of data should be highlighted with a non-standard color, for example, for use with errors.
     cols : int
@@ -32,6 +30,10 @@ class InfoDisplay(Control):
         The callback to call for opening the commander.
     filterer_hook : callable
         The callback to call for opening the filterer.
+    _layout : tuple
+        Cached column width, padded labels and value length limits. Invalidated when a new label is added.
+    _layout_key : tuple
+        The inner bounds and column count for which _layout was calculated.
     """
 
     def __init__(
@@ -44,16 +46,15 @@ class InfoDisplay(Control):
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
-        self.info = {}
-        self.order = info[:] if info is not None else []
+        self.info = dict.fromkeys(info) if info is not None else {}
         self.special_colors = {}
-        for k in info:
-            self.info[k] = None
         self.cols = cols
         self.highlight_color = highlight_color
         self.generic_color = generic_color
         self.commander_hook: Callable[[], None] = None
         self.filterer_hook: Callable[[], None] = None
+        self._layout = None
+        self._layout_key = None
 
     def input(self, key):
         if key == ":" and self.commander_hook is not None:
@@ -67,50 +68,54 @@ class InfoDisplay(Control):
         return False
 
     def __getitem__(self, key):
-        return self.info[key] if key in self.info else None
+        return self.info.get(key)
 
     def __setitem__(self, key, value):
-        if key not in self.order:
-            self.order.append(key)
+        if key not in self.info:
+            self._layout = None
         self.info[key] = value
 
+    @property
+    def order(self):
+        """
+        Read-only property that returns the order in which the info is displayed.
+        """
+        return list(self.info)
+
     def paint(self):
         super().paint()
-        (x0, x1), (y0, y1) = self.inner
-        width = x1 - x0 + 1
-        colw = int(width / self.cols)
-        x = x0
-        y = y0
-        longest = column_sizer(y0, y1, self.order, self.info)
-        col = 0
+        inner = self.inner
+        (x0, x1), (y0, y1) = inner
+        layout_key = (inner, self.cols)
+        rows = max(1, y1 - y0 + 1)
+        if self._layout is None or self._layout_key != layout_key:
+            width = x1 - x0 + 1
+            colw = width // self.cols
+            longest = column_sizer(y0, y1, self.info, None)
+            labels = {
+                name: (name + ": ").ljust(longest[idx // rows])
+                for idx, name in enumerate(self.info)
+            }
+            self._layout = (colw, labels, [colw - length for length in longest])
+            self._layout_key = layout_key
+        colw, labels, limits = self._layout
+        print_segments = Commons.UIInstance.print_segments
 
-        for name in self.order:
-            if name not in self.info:
-                continue
-            value = self.info[name]
+        for idx, (name, value) in enumerate(self.info.items()):
+            col, row = divmod(idx, rows)
             if value is None:
                 value = ""
-            display = name + ": "
-            if len(display) < longest[col]:
-                display += " " * (longest[col] - len(display))
-            Commons.UIInstance.print(
-                display, xy=(x, y), color=self.highlight_color, bold=True
-            )
-            text = value
-            if len(text) > colw - longest[col]:
-                text = text[: colw - longest[col]]
-            Commons.UIInstance.print(
-                text,
-                xy=(x + longest[col], y),
-                color=(
-                    self.generic_color
-                    if name not in self.special_colors
-                    else self.special_colors[name]
+            print_segments(
+                (
+                    (labels[name], self.highlight_color, True),
+                    (
+                        value[: limits[col]],
+                        self.special_colors.get(name, self.generic_color),
+                        False,
+                    ),
                 ),
+                (x0 + col * colw, y0 + row),
             )
-            y += 1
-            if y > y1:
-                (x, y, col) = (x + colw, y0, col + 1)
 
 
 class NeutralDialog(DialogControl):
@@ -4,10 +4,11 @@ Module for logging-related controls.
 
 import datetime
 import json
-from operator import attrgetter
+from operator import itemgetter
 
 from .base_control import GenericDescriber, OpenableListControl, datetime_hack
 from .common import Common
+from .termui.common import Commons
 from .termui.list_control import ListEntry
 
 
@@ -17,9 +18,12 @@ class LogViewer(GenericDescriber):
     """
 
     def __init__(self, *args, selection, **kwargs):
-        columns = selection.copy()
-        columns["context"] = json.loads(columns["context"])
-        content = json.dumps(columns, default=datetime_hack, indent=2, sort_keys=True)
+        content = json.dumps(
+            {**selection, "context": json.loads(selection["context"])},
+            default=datetime_hack,
+            indent=2,
+            sort_keys=True,
+        )
         super().__init__(
             *args,
             describing="logs",
@@ -57,38 +61,57 @@ class LogLister(OpenableListControl):
         self.logholder = Common._logholder
         self.logholder.attach(self)
 
+    @staticmethod
+    def build_entry(entry):
+        """
+        Converts a raw log entry into a list entry.
+
+        Parameters
+        ----------
+        entry : dict
+            The raw log entry.
+
+        Returns
+        -------
+        awsc.termui.list_control.ListEntry
+            The list entry representing the raw log entry.
+        """
+        subcategory = entry.get("subcategory")
+        return ListEntry(
+            entry["summary"],
+            category=entry["category"],
+            subcategory=subcategory if subcategory not in (None, "null") else "<n/a>",
+            resource=entry["resource"] if entry["resource"] is not None else "",
+            type=entry["type"],
+            timestamp=datetime.datetime.utcfromtimestamp(entry["timestamp"]).strftime(
+                "%Y-%m-%d %H:%M:%S UTC"
+            ),
+            raw_timestamp=entry["timestamp"],
+            message=entry["message"],
+            context=entry.get("context", {}),
+        )
+
     def add_raw_entry(self, entry):
         """
         Inserts a new raw entry. Callback for the logholder for pushing entries into the lister.
         """
-        self.add_entry(
-            ListEntry(
-                entry["summary"],
-                **{
-                    "category": entry["category"],
-                    "subcategory": (
-                        entry["subcategory"]
-                        if "subcategory" in entry
-                        and entry["subcategory"] is not None
-                        and entry["subcategory"] != "null"
-                        else "<n/a>"
-                    ),
-                    "resource": (
-                        entry["resource"] if entry["resource"] is not None else ""
-                    ),
-                    "type": entry["type"],
-                    "timestamp": datetime.datetime.utcfromtimestamp(
-                        entry["timestamp"]
-                    ).strftime("%Y-%m-%d %H:%M:%S UTC"),
-                    "raw_timestamp": entry["timestamp"],
-                    "message": entry["message"],
-                    "context": entry["context"] if "context" in entry else {},
-                },
-            )
-        )
+        self.add_entry(self.build_entry(entry))
+
+    def add_raw_entries(self, entries):
+        """
+        Inserts a batch of raw entries, sorting only once after all of them have been added. Callback for the logholder for populating the lister.
+
+        Parameters
+        ----------
+        entries : list(dict)
+            The raw log entries to insert.
+        """
+        self.entries.extend(self.build_entry(entry) for entry in entries)
+        self.sort()
+        Commons.UIInstance.dirty = True
 
     def sort(self):
-        self.entries.sort(reverse=True, key=attrgetter("raw_timestamp"))
+        self.entries.sort(reverse=True, key=itemgetter("raw_timestamp"))
         self._cache = None
 
     def on_close(self):
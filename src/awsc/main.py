@@ -2,19 +2,15 @@
 Main module for the awsc application.
 """
 
-import argparse
-import configparser
 import os
 import sys
-from pathlib import Path
+import tempfile
 
 import boto3
 
-# pylint: disable=unused-import # We use this import to enumerate all resource listers.
-from . import resources
 from .aws import AWS
 from .commander import Commander, Filterer
-from .common import Common, DefaultAnchor, DefaultDimension
+from .common import Common
 from .context import ContextList
 from .dashboard import Dashboard
 from .log import LogLister
@@ -31,7 +27,11 @@ def awscheck():
     """
     Predicate function for checking if AWS is initialized.
     """
-    return bool(Common.Session.context) and bool(Common.Session.region)
+    return Common.Session.aws_ready
+
+
+BarAnchor = TopLeftAnchor(0, 8)
+BarDimension = Dimension("100%", "3")
 
 
 def open_filterer():
@@ -41,8 +41,8 @@ def open_filterer():
     if Common.Session.filterer is None:
         return Filterer(
             Common.Session.ui.top_block,
-            TopLeftAnchor(0, 8),
-            Dimension("100%", "3"),
+            BarAnchor,
+            BarDimension,
             session=Common.Session,
             color=Common.color("search_bar_color"),
             symbol_color=Common.color("search_bar_symbol_color"),
@@ -61,8 +61,8 @@ def open_commander():
     """
     return Commander(
         Common.Session.ui.top_block,
-        TopLeftAnchor(0, 8),
-        Dimension("100%", "3"),
+        BarAnchor,
+        BarDimension,
         session=Common.Session,
         color=Common.color("command_bar_color"),
         symbol_color=Common.color("command_bar_symbol_color"),
@@ -78,12 +78,16 @@ def main(*args, **kwargs):
     """
     Entrypoint for awsc.
     """
+    # Importing every resource lister is expensive, and only the interactive UI needs them, so cred_helper skips it.
+    # pylint: disable=unused-import # We use this import to enumerate all resource listers.
+    from . import resources
+
     # stderr hack
     old_stderr = None
     try:
         Common.initialize()
 
-        if os.fstat(0) == os.fstat(1):
+        if os.path.samestat(os.fstat(0), os.fstat(1)):
             # pylint: disable=consider-using-with # With would be extremely roundabout here.
             log_file_handle = open(
                 Common.Configuration["error_log"], "w", buffering=1, encoding="utf-8"
@@ -103,16 +107,20 @@ def main(*args, **kwargs):
         Common.Session.info_display.commander_hook = open_commander
         Common.Session.info_display.filterer_hook = open_filterer
 
-        Common.Session.commander_options["ctx"] = ContextList.opener
-        Common.Session.commander_options["context"] = ContextList.opener
-        Common.Session.commander_options["region"] = RegionList.opener
-        Common.Session.commander_options["ssh"] = SSHList.opener
-        Common.Session.commander_options["sso"] = SSOList.opener
-        Common.Session.commander_options["logs"] = LogLister.opener
-        Common.Session.commander_options["?"] = CommanderOptionsLister.opener
-        Common.Session.commander_options["help"] = CommanderOptionsLister.opener
-        Common.Session.commander_options["pf"] = PortForwardList.opener
-        Common.Session.commander_options["portforward"] = PortForwardList.opener
+        Common.Session.commander_options.update(
+            {
+                "ctx": ContextList.opener,
+                "context": ContextList.opener,
+                "region": RegionList.opener,
+                "ssh": SSHList.opener,
+                "sso": SSOList.opener,
+                "logs": LogLister.opener,
+                "?": CommanderOptionsLister.opener,
+                "help": CommanderOptionsLister.opener,
+                "pf": PortForwardList.opener,
+                "portforward": PortForwardList.opener,
+            }
+        )
 
         Common.main()
     finally:
@@ -122,23 +130,27 @@ def main(*args, **kwargs):
 
 
 def cred_helper(*args, **kwargs):
-    parser = argparse.ArgumentParser(
-        prog="AWSC Credentials Helper",
-        description="Allows access to awsc credentials keystore for use with aws cli",
-    )
-    parser.add_argument("context")
-    args = parser.parse_args()
+    usage = "usage: AWSC Credentials Helper [-h] context"
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        print(
+            f"{usage}\n\nAllows access to awsc credentials keystore for use with aws cli"
+        )
+        sys.exit(0)
+    if len(sys.argv) != 2:
+        print(usage, file=sys.stderr)
+        sys.exit(2)
+    context_name = sys.argv[1]
     Common.initialize()
     conf = Common.Configuration
-    if args.context not in conf.keystore:
-        print(f"Keypair {args.context} not found.", file=sys.stderr)
-    keypair = conf.keystore[args.context]
+    if context_name not in conf.keystore:
+        print(f"Keypair {context_name} not found.", file=sys.stderr)
+    keypair = conf.keystore[context_name]
     sts = boto3.client(
         "sts",
         aws_access_key_id=keypair["access"],
         aws_secret_access_key=keypair["secret"],
     )
-    context = conf["contexts"][args.context]
+    context = conf["contexts"][context_name]
     if context["mfa_device"] != "":
         mfa_code = input(f"Enter MFA code for device {context['mfa_device']}: ")
         resp = sts.get_session_token(
@@ -149,46 +161,58 @@ def cred_helper(*args, **kwargs):
     else:
         resp = sts.get_session_token(DurationSeconds=86400)
 
-    aws_creds = Path.home() / ".aws" / "credentials"
+    # Replace the target of a symlinked credentials file rather than the link itself.
+    aws_creds = os.path.realpath(os.path.expanduser("~/.aws/credentials"))
+    header = f"[{context_name}]"
+    last_line = ""
+    # The rest of the credentials file is copied verbatim, only the section of the context is replaced.
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(aws_creds))
     try:
-        with aws_creds.open("r", encoding="utf-8") as file:
-            creds = file.read()
-    except OSError as error:
-        if error.errno == 2:  # FNF
-            creds = ""
-        else:
-            print(
-                f"Failed to open ~/.aws/credentials: {str(error)}",
-                file=sys.stderr,
+        with os.fdopen(handle, "w", encoding="utf-8", buffering=131072) as output:
+            try:
+                with open(aws_creds, "r", encoding="utf-8") as file:
+                    skipping = False
+                    for line in file:
+                        stripped = line.strip()
+                        if stripped.startswith("["):
+                            skipping = stripped == header
+                        if not skipping:
+                            output.write(line)
+                            last_line = line
+            except FileNotFoundError:
+                pass
+
+            if last_line and not last_line.endswith("\n"):
+                output.write("\n")
+            if last_line.strip() != "":
+                output.write("\n")
+            token = resp["Credentials"]["SessionToken"]
+            expiration = (
+                resp["Credentials"]["Expiration"]
+                .replace(tzinfo=None)
+                .isoformat(sep=" ", timespec="seconds")
             )
-            return
-
-    parser = configparser.ConfigParser(default_section="__default")
-    parser.read_string(creds)
-    if parser.has_section(args.context):
-        parser.remove_section(args.context)
-    parser.add_section(args.context)
-
-    token = resp["Credentials"]["SessionToken"]
-    expiration = resp["Credentials"]["Expiration"]
-    parser.set(args.context, "aws_session_token", token)
-    parser.set(args.context, "aws_security_token", token)
-    parser.set(
-        args.context,
-        "expiration",
-        expiration.strftime("%Y-%m-%d %H:%M:%S"),
-    )
-    parser.set(
-        args.context,
-        "aws_access_key_id",
-        resp["Credentials"]["AccessKeyId"],
-    )
-    parser.set(
-        args.context,
-        "aws_secret_access_key",
-        resp["Credentials"]["SecretAccessKey"],
-    )
-
-    with aws_creds.open("w", encoding="utf-8") as file:
-        parser.write(file)
-    print(f"Wrote short term token to profile {args.context}", file=sys.stderr)
+            output.write(
+                f"{header}\n"
+                f"aws_session_token = {token}\n"
+                f"aws_security_token = {token}\n"
+                f"expiration = {expiration}\n"
+                f"aws_access_key_id = {resp['Credentials']['AccessKeyId']}\n"
+                f"aws_secret_access_key = {resp['Credentials']['SecretAccessKey']}\n"
+                "\n"
+            )
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(temp_path, aws_creds)
+    except OSError as error:
+        # The temporary file holds a copy of every other profile's secrets, it must not be left behind.
+        os.unlink(temp_path)
+        print(
+            f"Failed to update ~/.aws/credentials: {str(error)}",
+            file=sys.stderr,
+        )
+        return
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    print(f"Wrote short term token to profile {context_name}", file=sys.stderr)
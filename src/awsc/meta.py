@@ -2,6 +2,9 @@
 Module for meta controls.
 """
 
+from operator import itemgetter
+from typing import List
+
 from .base_control import OpenableListControl
 from .common import Common
 from .termui.list_control import ListEntry
@@ -15,10 +18,19 @@ class CommanderOptionsLister(OpenableListControl):
     ----------
     phony : dict
         Deprecated. Legacy map of commands mapped to titles for bare ListControl subclasses.
+    _cached_options : dict
+        Shared between instances. The command palette options the cached entries were last built for.
+    _cached_phony : dict
+        Shared between instances. The phony titles the cached entries were last built for.
+    _cached_entries : list
+        Shared between instances. The entries built during the last reload.
     """
 
     title = "Commands"
     prefix = "help"
+    _cached_options: dict = {}
+    _cached_phony: dict = {}
+    _cached_entries: List[ListEntry] = []
 
     def __init__(self, *args, **kwargs):
         """
@@ -28,26 +40,43 @@ class CommanderOptionsLister(OpenableListControl):
         self.phony = {}
         self.column_titles = {}
         self.column_order = []
-        self.add_column("command", 12)
+        self.add_column("command", 24)
         self.add_column("resource", 48)
         self.reload()
 
     def reload(self):
         """
-        Reloads the list of available commands, repopulating the control.
+        Reloads the list of available commands, repopulating the control. Commands which are aliases of each other share a single entry.
+        Entries are only rebuilt if the available commands changed since the last reload.
         """
-        self.entries = []
-        for cmd in Common.Session.commander_options:
-            opt = Common.Session.commander_options[cmd]
-            if hasattr(opt, "__self__"):
-                list_entry = ListEntry(cmd, command=cmd, resource=opt.__self__.title)
-            elif cmd in self.phony:
-                list_entry = ListEntry(cmd, command=cmd, resource=self.phony[cmd])
-            else:
-                list_entry = ListEntry(cmd, command=cmd, resource="")
+        options = Common.Session.commander_options
+        if (
+            CommanderOptionsLister._cached_options == options
+            and CommanderOptionsLister._cached_phony == self.phony
+        ):
+            self.entries = CommanderOptionsLister._cached_entries[:]
+            return
+        aliases = {}
+        for cmd, opt in options.items():
+            aliases.setdefault(opt, []).append(cmd)
+        entries = []
+        for opt, cmds in aliases.items():
+            cmds.sort()
+            bound = getattr(opt, "__self__", None)
+            list_entry = ListEntry(
+                cmds[0],
+                command=", ".join(cmds),
+                resource=(
+                    bound.title if bound is not None else self.phony.get(cmds[0], "")
+                ),
+            )
             list_entry.controller_data["fn"] = opt
-            self.entries.append(list_entry)
-        self.entries.sort(key=lambda x: x["command"])
+            entries.append(list_entry)
+        entries.sort(key=itemgetter("command"))
+        CommanderOptionsLister._cached_options = dict(options)
+        CommanderOptionsLister._cached_phony = dict(self.phony)
+        CommanderOptionsLister._cached_entries = entries
+        self.entries = entries[:]
 
     @OpenableListControl.Autohotkey("KEY_ENTER", "Open", True)
     def open(self, _):
@@ -15,42 +15,36 @@ class RegionList(OpenableListControl):
     prefix = "region_list"
     title = "Regions"
 
+    region_columns = {"usage frequency": 0, "default": " "}
+    default_region_columns = {"usage frequency": 0, "default": "✓"}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.add_column("usage frequency", 12)
         self.add_column("default", 8)
-        regions = sorted(Common.Session.service_provider.list_regions())
-        for region in regions:
-            self.add_entry(
-                ListEntry(
-                    region,
-                    **{
-                        "usage frequency": 0,
-                        "default": (
-                            "✓"
-                            if region == Common.Configuration["default_region"]
-                            else " "
-                        ),
-                    }
-                )
-            )
-        try:
-            self.selected = regions.index(Common.Configuration["default_region"])
-        except ValueError:
-            self.selected = 0
+        self._default_entry = None
+        default_name = Common.Configuration["default_region"]
+        regions = Common.Session.service_provider.list_regions()
+        for idx, region in enumerate(regions):
+            if region == default_name:
+                self._default_entry = ListEntry(region, **self.default_region_columns)
+                self.add_entry(self._default_entry)
+                self.selected = idx
+            else:
+                self.add_entry(ListEntry(region, **self.region_columns))
 
     @OpenableListControl.Autohotkey("d", "Set as default", True)
     def set_default_region(self, _):
         """
         Hotkey callback for setting the default region.
         """
-        Common.Configuration["default_region"] = self.selection.name
+        selection = self.selection
+        Common.Configuration["default_region"] = selection.name
         Common.Configuration.write_config()
-        for entry in self.entries:
-            if entry.name != Common.Configuration["default_region"]:
-                entry["default"] = " "
-            else:
-                entry["default"] = "✓"
+        if self._default_entry is not None:
+            self._default_entry["default"] = " "
+        selection["default"] = "✓"
+        self._default_entry = selection
 
     @OpenableListControl.Autohotkey("KEY_ENTER", "Select", True)
     def select_region(self, _):
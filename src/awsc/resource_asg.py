@@ -2,6 +2,8 @@
 AWS Autoscaling Group resource controls.
 """
 
+from threading import Thread
+
 from .base_control import Describer, ResourceLister, SelectionAttribute, TemplateDict
 from .common import Common, SessionAwareDialog
 from .termui.control import Border
@@ -23,10 +25,12 @@ def _asg_determine_launch_info(asg, **kwargs):
     str
         The name of the launch configuration or launch template associated with the ASG, or empty if not found.
     """
-    if "LaunchConfigurationName" in asg and bool(asg["LaunchConfigurationName"]):
-        return asg["LaunchConfigurationName"]
-    if "LaunchTemplate" in asg:
-        return asg["LaunchTemplate"]["LaunchTemplateName"]
+    name = asg.get("LaunchConfigurationName")
+    if name:
+        return name
+    template = asg.get("LaunchTemplate")
+    if template is not None:
+        return template["LaunchTemplateName"]
     return ""
 
 
@@ -44,9 +48,12 @@ def _asg_determine_instance_count(asg, **kwargs):
     str
         The number of healthy and total instances in the group in the format of healthy/total.
     """
-    healthy = len([h for h in asg["Instances"] if h["HealthStatus"] == "Healthy"])
-    total = len(asg["Instances"])
-    return f"{healthy}/{total}"
+    instances = asg["Instances"]
+    healthy = 0
+    for instance in instances:
+        if instance["HealthStatus"] == "Healthy":
+            healthy += 1
+    return f"{healthy}/{len(instances)}"
 
 
 class ASGDescriber(Describer):
@@ -86,7 +93,10 @@ class ASGResourceLister(ResourceLister):
     category = "Autoscaling"
     subcategory = "Autoscaling Group"
     list_method = "describe_auto_scaling_groups"
+    list_kwargs = {"MaxRecords": 100}
     item_path = ".AutoScalingGroups"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
     columns = {
         "name": {
             "path": ".AutoScalingGroupName",
@@ -114,6 +124,7 @@ class ASGResourceLister(ResourceLister):
     describe_command = ASGDescriber.opener
     open_command = "i"
     primary_key = "name"
+    refresh_kwargs = TemplateDict({"AutoScalingGroupName": SelectionAttribute("name")})
 
     def title_info(self):
         return (
@@ -123,13 +134,13 @@ class ASGResourceLister(ResourceLister):
         )
 
     def matches(self, list_entry, *args):
-        if self.launch_config is not None:
-            if list_entry["launch config"] != self.launch_config["name"]:
-                return False
+        if self._lc_name is not None and list_entry["launch config"] != self._lc_name:
+            return False
         return super().matches(list_entry, *args)
 
     def __init__(self, *args, lc=None, **kwargs):
         self.launch_config = lc
+        self._lc_name = lc["name"] if lc is not None else None
         super().__init__(*args, **kwargs)
 
     @ResourceLister.Autohotkey(ControlCodes.S, tooltip="Scale", is_validated=True)
@@ -145,11 +156,7 @@ class ASGResourceLister(ResourceLister):
     def rollout(self, _):
         self.confirm_template(
             "start_instance_refresh",
-            TemplateDict(
-                {
-                    "AutoScalingGroupName": SelectionAttribute("name"),
-                }
-            ),
+            self.refresh_kwargs,
             action_name="Rollout",
         )(self.selection)
 
@@ -159,11 +166,7 @@ class ASGResourceLister(ResourceLister):
     def cancel_rollout(self, _):
         self.confirm_template(
             "cancel_instance_refresh",
-            TemplateDict(
-                {
-                    "AutoScalingGroupName": SelectionAttribute("name"),
-                }
-            ),
+            self.refresh_kwargs,
             action_name="Cancel rollout for",
         )(self.selection)
 
@@ -223,30 +226,69 @@ class ASGScaleDialog(SessionAwareDialog):
             self.error_label.text = "Desired capacity cannot be blank."
             return
 
-        b3s = Common.Session.service_provider("autoscaling")
-        asg = b3s.describe_auto_scaling_groups(
-            AutoScalingGroupNames=[self.asg_entry["name"]]
-        )["AutoScalingGroups"][0]
         des = int(self.desired_capacity_field.text)
-
-        if (
-            des < asg["MinSize"] or des > asg["MaxSize"]
-        ) and not self.adjust_limits_field.checked:
-            self.error_label.text = f"Desired capacity is out of min-max range of {asg['MinSize']}-{asg['MaxSize']}"
+        try:
+            min_size = int(self.asg_entry["min"])
+            max_size = int(self.asg_entry["max"])
+        except (KeyError, ValueError):
+            min_size = None
+            max_size = None
+        # The listed bounds may be stale. Only trust them when no widening is needed, otherwise check against the current bounds.
+        if min_size is None or des < min_size or des > max_size:
+            b3s = Common.Session.service_provider("autoscaling")
+            asg = b3s.describe_auto_scaling_groups(
+                AutoScalingGroupNames=[self.asg_entry["name"]]
+            )["AutoScalingGroups"][0]
+            min_size = asg["MinSize"]
+            max_size = asg["MaxSize"]
+
+        if (des < min_size or des > max_size) and not self.adjust_limits_field.checked:
+            self.error_label.text = (
+                f"Desired capacity is out of min-max range of {min_size}-{max_size}"
+            )
             return
 
-        nmin = min(des, asg["MinSize"])
-        nmax = max(des, asg["MaxSize"])
-
-        b3s.update_auto_scaling_group(
-            AutoScalingGroupName=self.asg_entry["name"],
-            DesiredCapacity=des,
-            MinSize=nmin,
-            MaxSize=nmax,
-        )
+        Thread(
+            target=self.scale,
+            args=(self.asg_entry["name"], des),
+            kwargs={
+                "min_size": des if des < min_size else None,
+                "max_size": des if des > max_size else None,
+            },
+            daemon=True,
+        ).start()
         super().accept_and_close()
 
-    def close(self):
-        if self.caller is not None:
+    def scale(self, name, desired, min_size=None, max_size=None):
+        """
+        Performs the scaling of the autoscaling group, then refreshes the caller if the call succeeded. Runs on a background thread so the
+        UI is not blocked while the API call is in flight.
+
+        Parameters
+        ----------
+        name : str
+            The name of the autoscaling group.
+        desired : int
+            The new desired capacity.
+        min_size : int, optional
+            The new minimum size, if it has to be lowered. The current minimum size is left untouched if None.
+        max_size : int, optional
+            The new maximum size, if it has to be raised. The current maximum size is left untouched if None.
+        """
+        api_kwargs = {"AutoScalingGroupName": name, "DesiredCapacity": desired}
+        if min_size is not None:
+            api_kwargs["MinSize"] = min_size
+        if max_size is not None:
+            api_kwargs["MaxSize"] = max_size
+        result = Common.generic_api_call(
+            "autoscaling",
+            "update_auto_scaling_group",
+            api_kwargs,
+            "Scale",
+            "Autoscaling",
+            subcategory="Autoscaling Group",
+            success_template="Scaling autoscaling group {0} to {DesiredCapacity}",
+            resource=name,
+        )
+        if result["Success"] and self.caller is not None:
             self.caller.refresh_data()
-        super().close()
@@ -2,6 +2,8 @@
 Module for Elastic Beanstalk-related resources.
 """
 
+from threading import Thread
+
 from .base_control import (
     AttributeResolver,
     Describer,
@@ -9,7 +11,6 @@ from .base_control import (
     DescriberKwarg,
     FieldValue,
     ForceFlag,
-    FString,
     IndexResolver,
     ResourceLister,
     ResourceRefByClass,
@@ -65,6 +66,12 @@ class EBApplicationResourceLister(ResourceLister):
     describe_command = EBApplicationDescriber.opener
     open_command = ResourceRefByCommand("elasticbeanstalkenvironment")
     open_selection_arg = "app"
+    delete_kwargs = TemplateDict(
+        {
+            "ApplicationName": SelectionAttribute("name"),
+            "TerminateEnvByForce": ForceFlag(),
+        }
+    )
 
     @ResourceLister.Autohotkey(ControlCodes.D, "Delete application", True)
     def delete_application(self, *args, **kwargs):
@@ -73,12 +80,7 @@ class EBApplicationResourceLister(ResourceLister):
         """
         self.confirm_template(
             "delete_application",
-            TemplateDict(
-                {
-                    "ApplicationName": SelectionAttribute("name"),
-                    "TerminateEnvByForce": ForceFlag(),
-                }
-            ),
+            self.delete_kwargs,
             can_force=True,
         )(self.selection)
 
@@ -123,7 +125,10 @@ class EBApplicationVersionResourceLister(ResourceLister):
     category = "Elastic Beanstalk"
     subcategory = "Appversion"
     list_method = "describe_application_versions"
+    list_kwargs = {"MaxRecords": 100}
     item_path = ".ApplicationVersions"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
     columns = {
         "application": {
             "path": ".ApplicationName",
@@ -137,20 +142,24 @@ class EBApplicationVersionResourceLister(ResourceLister):
         "name": {"path": ".VersionLabel", "hidden": True},
     }
     describe_command = EBApplicationVersionDescriber.opener
+    delete_kwargs = TemplateDict(
+        {
+            "ApplicationName": SelectionAttribute("name"),
+            "VersionLabel": SelectionAttribute("version"),
+        }
+    )
 
     def __init__(self, *args, application=None, **kwargs):
         self.application = application
         if application is not None:
-            self.list_kwargs = {"ApplicationName": self.application["name"]}
+            self.list_kwargs = {
+                **self.list_kwargs,
+                "ApplicationName": self.application["name"],
+            }
         super().__init__(*args, **kwargs)
         self.confirm_template(
             "delete_application_version",
-            TemplateDict(
-                {
-                    "ApplicationName": SelectionAttribute("name"),
-                    "VersionLabel": SelectionAttribute("version"),
-                }
-            ),
+            self.delete_kwargs,
             can_force=True,
             hotkey=ControlCodes.D,
             hotkey_tooltip="Delete appversion",
@@ -210,6 +219,8 @@ class EBEnvironmentLister(ResourceLister):
     subcategory = "Environment"
     list_method = "describe_environments"
     item_path = ".Environments"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
     columns = {
         "name": {"path": ".EnvironmentName", "size": 20, "weight": 0, "sort_weight": 1},
         "id": {"path": ".EnvironmentId", "size": 20, "weight": 1},
@@ -225,6 +236,20 @@ class EBEnvironmentLister(ResourceLister):
         "arn": {"path": ".EnvironmentArn", "hidden": True},
     }
     describe_command = EBEnvironmentDescriber.opener
+    terminate_kwargs = TemplateDict(
+        {
+            "EnvironmentName": SelectionAttribute("name"),
+            "ForceTerminate": ForceFlag(),
+            "TerminateResources": FieldValue("terminate_resources_field"),
+        }
+    )
+    delete_config_kwargs = TemplateDict(
+        {
+            "EnvironmentName": SelectionAttribute("name"),
+            "ApplicationName": SelectionAttribute("application"),
+        }
+    )
+    rebuild_kwargs = TemplateDict({"EnvironmentName": SelectionAttribute("name")})
 
     @ResourceLister.Autohotkey(ControlCodes.D, "Terminate environment", True, True)
     def delete_environment(self, _):
@@ -233,13 +258,7 @@ class EBEnvironmentLister(ResourceLister):
         """
         self.confirm_template(
             "terminate_environment",
-            TemplateDict(
-                {
-                    "EnvironmentName": SelectionAttribute("name"),
-                    "ForceTerminate": ForceFlag(),
-                    "TerminateResources": FieldValue("terminate_resources_field"),
-                }
-            ),
+            self.terminate_kwargs,
             can_force=True,
             extra_fields={
                 "terminate_resources_field": DialogFieldCheckbox(
@@ -258,12 +277,7 @@ class EBEnvironmentLister(ResourceLister):
         """
         self.confirm_template(
             "delete_environment_config",
-            TemplateDict(
-                {
-                    "EnvironmentName": SelectionAttribute("name"),
-                    "ApplicationName": SelectionAttribute("application"),
-                }
-            ),
+            self.delete_config_kwargs,
             resource_type="environment configuration",
         )(self.selection)
 
@@ -274,11 +288,7 @@ class EBEnvironmentLister(ResourceLister):
         """
         self.confirm_template(
             "rebuild_environment",
-            TemplateDict(
-                {
-                    "EnvironmentName": SelectionAttribute("name"),
-                }
-            ),
+            self.rebuild_kwargs,
             action_name="Rebuild",
         )(self.selection)
 
@@ -312,7 +322,18 @@ class EBEnvironmentLister(ResourceLister):
             "SourceEnvironmentName": self.selection["name"],
             "DestinationEnvironmentName": other_env,
         }
-        Common.generic_api_call(
+        Thread(
+            target=self.swap,
+            args=(api_kwargs, f"{self.selection['name']}, {other_env}"),
+            daemon=True,
+        ).start()
+
+    def swap(self, api_kwargs, resource):
+        """
+        Performs the environment cname swap, then refreshes the list. Runs on a background thread so the UI is not blocked while the API
+        call is in flight.
+        """
+        result = Common.generic_api_call(
             "elasticbeanstalk",
             "swap_environment_cnames",
             api_kwargs,
@@ -320,14 +341,15 @@ class EBEnvironmentLister(ResourceLister):
             "Elastic Beanstalk",
             subcategory="Environment",
             success_template="Swapping cnames for environments {0}",
-            resource=f"{self.selection['name']}, {other_env}",
+            resource=resource,
         )
-        self.refresh_data()
+        if result["Success"]:
+            self.refresh_data()
 
     def __init__(self, *args, app=None, **kwargs):
-        self.app = app["name"]
+        self.app = None if app is None else app["name"]
         if app is not None:
-            self.list_kwargs["ApplicationName"] = self.app
+            self.list_kwargs = {**self.list_kwargs, "ApplicationName": self.app}
         super().__init__(*args, **kwargs)
 
     def title_info(self):
@@ -409,6 +431,9 @@ class EBPlatformBranchLister(ResourceLister):
     subcategory = "Platform Branch"
     list_method = "list_platform_branches"
     item_path = ".PlatformBranchSummaryList"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
+    response_ttl = 3600
     columns = {
         "platform": {
             "path": ".PlatformName",
@@ -464,7 +489,11 @@ class EBPlatformVersionLister(ResourceLister):
     category = "Elastic Beanstalk"
     subcategory = "Platform Version"
     list_method = "list_platform_versions"
+    list_kwargs = {"MaxRecords": 100}
     item_path = ".PlatformSummaryList"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
+    response_ttl = 3600
     columns = {
         "owner": {
             "path": ".PlatformOwner",
@@ -500,13 +529,14 @@ class EBPlatformVersionLister(ResourceLister):
         self.branch = branch
         if branch is not None:
             self.list_kwargs = {
+                **self.list_kwargs,
                 "Filters": [
                     {
                         "Type": "PlatformBranchName",
                         "Operator": "=",
                         "Values": [branch["name"]],
                     }
-                ]
+                ],
             }
         super().__init__(*args, **kwargs)
 
@@ -524,16 +554,24 @@ class EBInstanceHealthDescriber(Describer):
     category = "Elastic Beanstalk"
     subcategory = "Instance Health"
     describe_method = "describe_instances_health"
-    describe_kwarg_name = "VersionLabels"
     describe_kwargs_override = {
         "EnvironmentName": DescriberKwarg(
             "caller",
             resolver=AttributeResolver("environment", resolver=IndexResolver("name")),
         )
     }
-    object_path = FString(".InstanceList[] | select(.InstanceId=={entry_id}))")
+    object_path = ".InstanceHealthList"
     default_entry_key = "instance id"
 
+    def pre_display_transform(self, data):
+        """
+        Selects the described instance from the instance health list.
+        """
+        for instance in data or []:
+            if instance["InstanceId"] == self.entry_id:
+                return instance
+        return None
+
 
 @ResourceLister.Autocommand(
     "EBEnvironmentLister", "i", "View instance healths", "environment"
@@ -552,6 +590,8 @@ class EBInstanceHealthLister(ResourceLister):
     subcategory = "Instance Health"
     list_method = "describe_instances_health"
     item_path = ".InstanceHealthList"
+    next_marker = "NextToken"
+    next_marker_arg = "NextToken"
     columns = {
         "instance id": {
             "path": ".InstanceId",
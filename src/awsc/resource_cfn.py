@@ -3,6 +3,9 @@ Module for Cloudformation-related resources.
 """
 
 import datetime
+import functools
+import time
+from typing import Dict
 
 from .arn import ARN
 from .base_control import (
@@ -10,11 +13,13 @@ from .base_control import (
     MultiLister,
     NoResults,
     ResourceLister,
+    compile_column_path,
     format_timedelta,
     tag_finder_generator,
 )
 from .common import Common
 from .resource_common import multilister_with_compare_path
+from .termui.ui import ControlCodes
 
 
 class CFNDescriber(Describer):
@@ -42,14 +47,98 @@ class CFNDescriber(Describer):
             return
 
 
+_cfn_stack_id_tag = tag_finder_generator("aws:cloudformation:stack-id", default=None)
+_cfn_rds_stack_id_tag = tag_finder_generator(
+    "aws:cloudformation:stack-id", default=None, taglist_key="TagList"
+)
+_cfn_name_tag = tag_finder_generator("Name")
+
+
+def _cfn_constant_column(value):
+    """
+    Column callback factory. Returns a function which returns value for every item.
+    """
+
+    def fn(raw_item, **kwargs):
+        return value
+
+    return fn
+
+
+_cfn_empty = _cfn_constant_column("")
+
+_cfn_tagged_resources = (
+    # resource_key, list_method, item_path, type, id column, name column
+    (
+        "autoscaling",
+        "describe_auto_scaling_groups",
+        ".AutoScalingGroups",
+        "Autoscaling Group",
+        _cfn_empty,
+        ".AutoScalingGroupName",
+    ),
+    ("ec2", "describe_vpcs", ".Vpcs", "VPC", ".VpcId", _cfn_name_tag),
+    ("ec2", "describe_subnets", ".Subnets", "VPC Subnet", ".SubnetId", _cfn_name_tag),
+    (
+        "ec2",
+        "describe_route_tables",
+        ".RouteTables",
+        "Route Table",
+        ".RouteTableId",
+        _cfn_name_tag,
+    ),
+)
+
+
+def _cfn_tagged_descriptor(row):
+    """
+    Builds a MultiLister descriptor from a row of _cfn_tagged_resources.
+    """
+    resource_key, list_method, item_path, resource_type, id_column, name_column = row
+    return {
+        "resource_key": resource_key,
+        "list_method": list_method,
+        "list_kwargs": {},
+        "item_path": item_path,
+        "column_paths": {
+            "type": _cfn_constant_column(resource_type),
+            "id": id_column,
+            "name": name_column,
+        },
+        "hidden_columns": {},
+        "compare_as_list": False,
+        "compare_path": _cfn_stack_id_tag,
+    }
+
+
+_cfn_tagged_descriptors = (
+    multilister_with_compare_path("ec2", _cfn_stack_id_tag),
+    multilister_with_compare_path("rds", _cfn_rds_stack_id_tag),
+    *(_cfn_tagged_descriptor(row) for row in _cfn_tagged_resources),
+)
+"""
+Descriptors for resources which carry the aws:cloudformation:stack-id tag. These do not depend on the stack being browsed, so they are built
+once and shared by every CFNRelated instance.
+"""
+
+
 # TODO: Refactor
 class CFNRelated(MultiLister):
     """
     Related resource lister for Cloudformation Stack resources.
+
+    Attributes
+    ----------
+    stack_resources_ttl : int
+        The number of seconds the physical resource IDs of a stack are reused for before list_stack_resources is called again. Pressing
+        the refresh hotkey always fetches them anew.
     """
 
     prefix = "cfn_related"
     title = "Resources in CloudFormation Stack"
+    list_workers = 8
+    stack_resources_ttl = 60
+    _stack_resources: Dict[tuple, tuple] = {}
 
     def title_info(self):
         return self.compare_value
@@ -58,34 +147,15 @@ class CFNRelated(MultiLister):
         self.stack_res_list = {}
         kwargs["compare_key"] = "arn"
         self.resource_descriptors = [
-            multilister_with_compare_path(
-                "ec2", '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value'
-            ),
-            multilister_with_compare_path(
-                "rds", '.TagList[] | select(.Key=="aws:cloudformation:stack-id").Value'
-            ),
-            {
-                "resource_key": "autoscaling",
-                "list_method": "describe_auto_scaling_groups",
-                "list_kwargs": {},
-                "item_path": ".AutoScalingGroups",
-                "column_paths": {
-                    "type": lambda x: "Autoscaling Group",
-                    "id": self.empty,
-                    "name": ".AutoScalingGroupName",
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
+            *_cfn_tagged_descriptors,
             {
                 "resource_key": "elbv2",
                 "list_method": "describe_load_balancers",
                 "list_kwargs": {},
                 "item_path": ".LoadBalancers",
                 "column_paths": {
-                    "type": lambda x: "Load Balancer",
-                    "id": self.empty,
+                    "type": _cfn_constant_column("Load Balancer"),
+                    "id": _cfn_empty,
                     "name": ".LoadBalancerName",
                 },
                 "hidden_columns": {
@@ -102,7 +172,7 @@ class CFNRelated(MultiLister):
                 "list_kwargs": {},
                 "item_path": ".TargetGroups",
                 "column_paths": {
-                    "type": lambda x: "Target Group",
+                    "type": _cfn_constant_column("Target Group"),
                     "id": self.resource_id_from_arn_generator(".TargetGroupArn"),
                     "name": ".TargetGroupName",
                 },
@@ -122,9 +192,9 @@ class CFNRelated(MultiLister):
                 ),
                 "item_path": ".Listeners",
                 "column_paths": {
-                    "type": lambda x: "Listener",
+                    "type": _cfn_constant_column("Listener"),
                     "id": self.full_resource_id_from_arn_generator(".ListenerArn"),
-                    "name": self.empty,
+                    "name": _cfn_empty,
                 },
                 "hidden_columns": {
                     "arn": ".ListenerArn",
@@ -134,41 +204,13 @@ class CFNRelated(MultiLister):
                     "AWS::ElasticLoadBalancingV2::Listener", ".ListenerArn"
                 ),
             },
-            {
-                "resource_key": "ec2",
-                "list_method": "describe_vpcs",
-                "list_kwargs": {},
-                "item_path": ".Vpcs",
-                "column_paths": {
-                    "type": lambda x: "VPC",
-                    "id": ".VpcId",
-                    "name": tag_finder_generator("Name"),
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
-            {
-                "resource_key": "ec2",
-                "list_method": "describe_subnets",
-                "list_kwargs": {},
-                "item_path": ".Subnets",
-                "column_paths": {
-                    "type": lambda x: "VPC Subnet",
-                    "id": ".SubnetId",
-                    "name": tag_finder_generator("Name"),
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
             {
                 "resource_key": "route53",
                 "list_method": "list_hosted_zones",
                 "list_kwargs": {},
                 "item_path": ".HostedZones",
                 "column_paths": {
-                    "type": lambda x: "Route53 Zone",
+                    "type": _cfn_constant_column("Route53 Zone"),
                     "id": ".Id",
                     "name": ".Name",
                 },
@@ -178,50 +220,23 @@ class CFNRelated(MultiLister):
                     "AWS::Route53::HostedZone", ".Id"
                 ),
             },
-            {
-                "resource_key": "ec2",
-                "list_method": "describe_vpcs",
-                "list_kwargs": {},
-                "item_path": ".Vpcs",
-                "column_paths": {
-                    "type": lambda x: "VPC",
-                    "id": ".VpcId",
-                    "name": tag_finder_generator("Name"),
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
-            {
-                "resource_key": "ec2",
-                "list_method": "describe_subnets",
-                "list_kwargs": {},
-                "item_path": ".Subnets",
-                "column_paths": {
-                    "type": lambda x: "Subnet",
-                    "id": ".SubnetId",
-                    "name": tag_finder_generator("Name"),
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
-            {
-                "resource_key": "ec2",
-                "list_method": "describe_route_tables",
-                "list_kwargs": {},
-                "item_path": ".RouteTables",
-                "column_paths": {
-                    "type": lambda x: "Route Table",
-                    "id": ".RouteTableId",
-                    "name": tag_finder_generator("Name"),
-                },
-                "hidden_columns": {},
-                "compare_as_list": False,
-                "compare_path": '.Tags[] | select(.Key=="aws:cloudformation:stack-id").Value',
-            },
         ]
         super().__init__(*args, **kwargs)
+        self.add_hotkey(ControlCodes.R, self.reload_data, "Refresh")
+
+    def _stack_resources_key(self):
+        return (
+            Common.Session.context,
+            Common.Session.region,
+            self.orig_compare_value["name"],
+        )
+
+    def reload_data(self, *args):
+        """
+        Hotkey callback. Discards the cached stack resources of this stack and refreshes the list.
+        """
+        CFNRelated._stack_resources.pop(self._stack_resources_key(), None)
+        self.refresh_data()
 
     def full_resource_id_from_arn_generator(self, arn_path):
         """
@@ -238,9 +253,10 @@ class CFNRelated(MultiLister):
             A function which retrieves the full resource ID from the ARN at arn_path.
         """
 
-        def fn(raw_item):
-            arn = ARN(Common.Session.jq(arn_path).input(raw_item).first())
-            return arn.resource_id
+        arn_column = compile_column_path(arn_path)
+
+        def fn(raw_item, **kwargs):
+            return ARN(arn_column(raw_item)).resource_id
 
         return fn
 
@@ -259,9 +275,10 @@ class CFNRelated(MultiLister):
             A function which retrieves the first resource ID from the ARN at arn_path.
         """
 
-        def fn(raw_item):
-            arn = ARN(Common.Session.jq(arn_path).input(raw_item).first())
-            return arn.resource_id_first
+        arn_column = compile_column_path(arn_path)
+
+        def fn(raw_item, **kwargs):
+            return ARN(arn_column(raw_item)).resource_id_first
 
         return fn
 
@@ -288,12 +305,10 @@ class CFNRelated(MultiLister):
             A function which returns the stack ID of this stack if the resource is present in the stack, or None otherwise.
         """
 
+        physical_id_column = compile_column_path(physical_id_path)
+
         def fn(raw_item):
-            phys_id = Common.Session.jq(physical_id_path).input(raw_item).first()
-            if (
-                cfn_type in self.stack_res_list
-                and phys_id in self.stack_res_list[cfn_type]
-            ):
+            if physical_id_column(raw_item) in self.stack_res_list.get(cfn_type, ()):
                 return self.compare_value
             return None
 
@@ -319,39 +334,52 @@ class CFNRelated(MultiLister):
 
         def fn():
             if cfn_type in self.stack_res_list:
-                return {kwarg: self.stack_res_list[cfn_type]}
+                return {kwarg: list(self.stack_res_list[cfn_type])}
             raise NoResults
 
         return fn
 
     def async_inner(self, *args, fn, clear=False, **kwargs):
-        resource_list = {}
-        self.stack_res_list = {}
-        while True:
-            rargs = {"StackName": self.orig_compare_value["name"]}
-            if "NextToken" in resource_list and resource_list["NextToken"] is not None:
-                rargs["NextToken"] = resource_list["NextToken"]
-            resource_list = Common.Session.service_provider(
-                "cloudformation"
-            ).list_stack_resources(**rargs)
+        cache_key = self._stack_resources_key()
+        cached = CFNRelated._stack_resources.get(cache_key)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self.stack_resources_ttl
+        ):
+            self.stack_res_list = cached[1]
+            return super().async_inner(*args, fn=fn, clear=clear, **kwargs)
+        stack_res_list = {}
+        paginator = Common.Session.service_provider("cloudformation").get_paginator(
+            "list_stack_resources"
+        )
+        for resource_list in paginator.paginate(
+            StackName=self.orig_compare_value["name"]
+        ):
             for item in resource_list["StackResourceSummaries"]:
-                if item["ResourceType"] not in self.stack_res_list:
-                    self.stack_res_list[item["ResourceType"]] = []
-                self.stack_res_list[item["ResourceType"]].append(
-                    item["PhysicalResourceId"]
-                )
-            if "NextToken" not in resource_list or resource_list["NextToken"] is None:
-                break
+                if item["ResourceType"] not in stack_res_list:
+                    stack_res_list[item["ResourceType"]] = []
+                stack_res_list[item["ResourceType"]].append(item["PhysicalResourceId"])
+        stack_res_list = {
+            resource_type: frozenset(physical_ids)
+            for resource_type, physical_ids in stack_res_list.items()
+        }
+        self.stack_res_list = stack_res_list
+        CFNRelated._stack_resources[cache_key] = (time.monotonic(), stack_res_list)
         return super().async_inner(*args, fn=fn, clear=clear, **kwargs)
 
 
+@functools.lru_cache(maxsize=1024)
+def _cfn_parse_time(timestamp):
+    return datetime.datetime.fromisoformat(timestamp)
+
+
 def _cfn_determine_created(cfn, **kwargs):
     """
     Column callback for extracting when a stack was created.
     """
     return format_timedelta(
         datetime.datetime.now(datetime.timezone.utc)
-        - datetime.datetime.fromisoformat(cfn["CreationTime"])
+        - _cfn_parse_time(cfn["CreationTime"])
     )
 
 
@@ -359,12 +387,10 @@ def _cfn_determine_updated(cfn, **kwargs):
     """
     Column callback for extracting when a stack was updated.
     """
-    if "LastUpdatedTime" in cfn:
-        return format_timedelta(
-            datetime.datetime.now(datetime.timezone.utc)
-            - datetime.datetime.fromisoformat(cfn["LastUpdatedTime"])
-        )
-    return _cfn_determine_created(cfn)
+    return format_timedelta(
+        datetime.datetime.now(datetime.timezone.utc)
+        - _cfn_parse_time(cfn.get("LastUpdatedTime", cfn["CreationTime"]))
+    )
 
 
 class CFNResourceLister(ResourceLister):
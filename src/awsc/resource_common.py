@@ -13,7 +13,7 @@ MULTILISTER_DESCRIPTORS = {
         "list_kwargs": {},
         "item_path": "[.Reservations[].Instances[]]",
         "column_paths": {
-            "type": lambda x: "EC2 Instance",
+            "type": lambda x, **kwargs: "EC2 Instance",
             "id": ".InstanceId",
             "name": tag_finder_generator("Name"),
         },
@@ -25,7 +25,7 @@ MULTILISTER_DESCRIPTORS = {
         "list_kwargs": {},
         "item_path": ".DBInstances",
         "column_paths": {
-            "type": lambda x: "RDS Instance",
+            "type": lambda x, **kwargs: "RDS Instance",
             "id": ".DBInstanceIdentifier",
             "name": ".Endpoint.Address",
         },
@@ -45,8 +45,8 @@ def multilister_with_compare_path(resource_key, compare_path, compare_as_list=Fa
     ----------
     resource_key : str
         Key in MULTILISTER_DESCRIPTORS.
-    compare_path : str
-        The compare path to set.
+    compare_path : str or callable(dict) -> object
+        The compare path to set. Either a jq expression, or a function which returns the value to compare for a raw item.
     compare_as_list : bool
         The value to set for compare_as_list.
 
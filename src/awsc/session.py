@@ -11,6 +11,7 @@ import tempfile
 import time
 import urllib.error
 import urllib.request
+from threading import Thread
 
 import jq
 from packaging import version
@@ -48,6 +49,8 @@ class Session:
         Current AWS context.
     _region : str
         Current AWS region.
+    aws_ready : bool
+        Whether both a context and a region are selected.
     _ssh_key : str
         Current SSH key.
     stack : list
@@ -135,6 +138,8 @@ class Session:
         for elem in self._message_labels:
             self.message_display.add_field(elem)
         self._context = None
+        self._region = None
+        self.aws_ready = False
         self.context_is_valid = False
         self.context = config["default_context"]
         self.region = config["default_region"]
@@ -157,7 +162,9 @@ class Session:
         self.control_registry = {}
         atexit.register(self.cleanup_port_forwards)
 
-        self.set_version_information()
+        # The PyPI lookup is a network round trip, keep it off the startup path.
+        self.info_display["AWSC Version"] = current_version
+        Thread(target=self.set_version_information, daemon=True).start()
 
     def set_version_information(self):
         """
@@ -423,10 +430,12 @@ class Session:
     def context(self, value):
         if value == '' or value is None:
             self._context = None
+            self.aws_ready = False
             self.info_display["Context"] = "<No context>"
             self.context_is_valid = False
         else:
             self._context = value
+            self.aws_ready = bool(self._region)
             self.context_is_valid = True
             self.info_display["Context"] = value
             data = self.context_data
@@ -502,6 +511,7 @@ class Session:
     @region.setter
     def region(self, value):
         self._region = value
+        self.aws_ready = bool(self._context) and bool(value)
         self.info_display["Region"] = value
 
     @property
@@ -327,6 +327,44 @@ class UI:
             if not wrap or xy[1] >= bounds[1][1]:
                 end = True
 
+    def print_segments(self, segments, xy, bounds=None):
+        """
+        Prints a sequence of differently formatted texts next to each other on a single row of the screen buffer. Equivalent to calling
+        print for each segment with an advancing x coordinate, but resolves the target row only once. Overflow is cut off.
+
+        Parameters
+        ----------
+        segments : list(tuple(str, awsc.termui.color.Color, bool))
+            The segments to print, as tuples of text, color and whether the text should be bold.
+        xy : tuple(int, int)
+            Where to print the first segment on the screen.
+        bounds : tuple(tuple(int, int), tuple(int, int)), optional
+            The bounding box for printing the text. If omitted, the bounding box is the entire terminal.
+        """
+        if bounds is None:
+            bounds = ((0, self.width), (0, self.height))
+        (x, y) = xy
+        if x > bounds[0][1] or y > bounds[1][1]:
+            return
+        self.dirty = True
+        try:
+            row = self.buf[y].buf
+        except IndexError:
+            return
+        end = min(bounds[0][1], len(row))
+        for out, color, bold in segments:
+            if color is not None and not callable(color):
+                raise ValueError("Color must be callable or None.")
+            for value in out:
+                if x >= end:
+                    return
+                char = row[x]
+                char.value = value
+                char.color = color
+                char.bold = bold
+                char.dirty = True
+                x += 1
+
     def refresh_size(self):
         """
         Refreshes the cached width and height of the terminal if it has not been refreshed recently.